@@ -47,10 +47,16 @@ display_drv = FBDisplay(dcfb)
 
 touch_drv = adafruit_focaltouch.Adafruit_FocalTouch(i2c, address=0x48)
 
+# Read the first touch point straight from the FT6x36 registers into a
+# preallocated buffer.  touch_drv.touches builds a list of dicts on every poll.
+_touch_reg = bytes((0x02,))  # TD_STATUS, followed by P1_XH, P1_XL, P1_YH, P1_YL
+_touch_buf = bytearray(5)
+
 def touch_read_func():
-    touches = touch_drv.touches
-    for touch in touches:
-        return touch["x"], touch["y"]
+    with touch_drv._i2c as i2c:
+        i2c.write_then_readinto(_touch_reg, _touch_buf)
+    if _touch_buf[0] & 0x0F:
+        return ((_touch_buf[1] & 0x0F) << 8) | _touch_buf[2], ((_touch_buf[3] & 0x0F) << 8) | _touch_buf[4]
     return None
 
 touch_rotation_table=(0, 0, 0, 0)
@@ -15,7 +15,7 @@ display_bus = SPIBus(
     sclk=12,
     host=1,
     tx_only=True,
-    freq=60_000_000,
+    freq=80_000_000,
     spi_mode=0,
     cmd_bits=8,
     param_bits=8,
@@ -26,7 +26,10 @@ display_bus = I80Bus(
     data5=17,
     data6=16,
     data7=15,
-    freq=10_000_000,
+    # 10 MHz is the highest clock verified on this board; 20 MHz is a conservative step up.
+    # 40 MHz is untested.  Check the WR strobe and data lines with a logic analyzer before
+    # raising it, and drop back to 10_000_000 if the display shows artifacts.
+    freq=20_000_000,
 )
 
 display_drv = ST7796(
@@ -8,13 +8,21 @@ Usage:
     from hardware_setup import display
     <your code here>
 '''
+import sys
 from displaybuf import DisplayBuffer as SSD
 from board_config import display_drv
 from mpdisplay import Events
 
-# format = SSD.GS4_HMSB  # 4-bit (16 item) lookup table of 16-bit RGB565 colors; w*h/2 buffer
-# format = SSD.GS8  # 256 8-bit RGB332 colors; w*h buffer
-format = SSD.RGB565  # all 65,536 16-bit RGB565 colors; w*h*2 buffer
+# GS4_HMSB keeps the buffer at a quarter of the size of RGB565 (75 KiB vs 300 KiB at 320x480),
+# small enough to stay in SRAM on most boards instead of much slower PSRAM.
+# Boards with plenty of fast RAM can switch to GS8 or RGB565.
+# DisplayBuffer only implements GS8 and GS4_HMSB on MicroPython, so other targets use RGB565.
+if sys.implementation.name == "micropython":
+    format = SSD.GS4_HMSB  # 4-bit (16 item) lookup table of 16-bit RGB565 colors; w*h/2 buffer
+    # format = SSD.GS8  # 256 8-bit RGB332 colors; w*h buffer
+    # format = SSD.RGB565  # all 65,536 16-bit RGB565 colors; w*h*2 buffer
+else:
+    format = SSD.RGB565
 
 ssd = SSD(display_drv, format)
 
@@ -11,6 +11,13 @@ from mpdisplay import Events
 if hasattr(display_drv, "set_device_data"):
     from mpdisplay import Device_types
 
+    # Look up the touch device once instead of on every set_rotation_table call.
+    # None if no touch device is registered.
+    touch_id = None
+    for device in display_drv._devices:
+        if device.type == Device_types.TOUCH:
+            touch_id = device.id
+            break
     demo = False
 else:
     demo = True
@@ -31,9 +38,8 @@ REVERSE_Y = 0b100
 
 
 def set_rotation_table(table):
-    for device in display_drv._devices:
-        if device.type == Device_types.TOUCH:
-            display_drv.set_device_data(device.id, table)
+    if touch_id is not None:
+        display_drv.set_device_data(touch_id, table)
 
 
 def loop():
@@ -52,44 +58,37 @@ def loop():
         half_width = width // 2
         half_height = height // 2
 
-        for y in range(2):
-            for x in range(2):
-                display_drv.round_rect(
-                    x * half_width + 10,
-                    y * half_height + 10,
-                    half_width - 20,
-                    half_height - 20,
-                    10,
-                    FG_COLOR,
-                    True,
-                )
-                display_drv.btext(
-                    text,
-                    x * half_width + ((half_width - text_width) // 2),
-                    y * half_height + ((half_height - 8) // 2),
-                    BG_COLOR,
-                )
-                touched_point = None
-                while not touched_point:
-                    event = display_drv.poll()
-                    if (
-                        event
-                        and event.type == Events.MOUSEBUTTONDOWN
-                        and event.button == 1
-                    ):
-                        touched_point = event.pos
-                zone = (touched_point[1] // half_height) * 2 + (
-                    touched_point[0] // half_width
-                )
-                touched_zones.append(zone)
-                print(f"{touched_point=} in {zone=}")
-                display_drv.fill_rect(
-                    x * half_width,
-                    y * half_height,
-                    half_width - 1,
-                    half_height - 1,
-                    BG_COLOR,
-                )
+        # The rectangle to touch in each corner, in the order they are shown
+        corners = [
+            (x * half_width + 10, y * half_height + 10, half_width - 20, half_height - 20)
+            for y in range(2)
+            for x in range(2)
+        ]
+
+        for corner_x, corner_y, corner_w, corner_h in corners:
+            display_drv.round_rect(corner_x, corner_y, corner_w, corner_h, 10, FG_COLOR, True)
+            display_drv.btext(
+                text,
+                corner_x + ((corner_w - text_width) // 2),
+                corner_y + ((corner_h - 8) // 2),
+                BG_COLOR,
+            )
+            touched_point = None
+            while not touched_point:
+                event = display_drv.poll()
+                if (
+                    event
+                    and event.type == Events.MOUSEBUTTONDOWN
+                    and event.button == 1
+                ):
+                    touched_point = event.pos
+            zone = (touched_point[1] // half_height) * 2 + (
+                touched_point[0] // half_width
+            )
+            touched_zones.append(zone)
+            print(f"{touched_point=} in {zone=}")
+            # Erase only the rectangle that was drawn, not the whole quarter of the screen
+            display_drv.round_rect(corner_x, corner_y, corner_w, corner_h, 10, BG_COLOR, True)
 
         if touched_zones == [0, 1, 2, 3]:
             mask = 0b0
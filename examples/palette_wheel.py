@@ -15,10 +15,13 @@ line_height = 2
 i = 0
 def main():
     global i
+    # BusDisplay.fill_rect sends the whole stripe as one band, so there is no need to build a buffer here
+    width = display_drv.width
+    height = display_drv.height
     for color in palette:
-        if i >= display_drv.height:
-            display_drv.vscsad((line_height + i) % display_drv.height)
-        display_drv.fill_rect(0, i % display_drv.height, display_drv.width, line_height, color)
+        if i >= height:
+            display_drv.vscsad((line_height + i) % height)
+        display_drv.fill_rect(0, i % height, width, line_height, color)
         i += line_height
 
 def loop():
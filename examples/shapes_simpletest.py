@@ -27,43 +27,62 @@ triangle = array("h", [0, 0, WIDTH // 2, -HEIGHT // 4, WIDTH - 1, 0])
 
 # Main loop
 def main(animate=False, text1="Shapes", text2="simpletest", poly=triangle):
-    y_range = range(HEIGHT - 1, -1, -1) if animate else [HEIGHT - 1]
+    # Bind the driver, drawing functions and colors to locals once so the
+    # animation loop doesn't look them up on every frame.
+    drv = display_drv
+    fill, poly_, fill_rect, line, rect = shapes.fill, shapes.poly, shapes.fill_rect, shapes.line, shapes.rect
+    hline, vline, pixel, ellipse, text_ = shapes.hline, shapes.vline, shapes.pixel, shapes.ellipse, text
+    w, h = WIDTH, HEIGHT
+    BLACK, WHITE, YELLOW, GREY = pal.BLACK, pal.WHITE, pal.YELLOW, pal.GREY
+    RED, GREEN, BLUE, MAGENTA, CYAN = pal.RED, pal.GREEN, pal.BLUE, pal.MAGENTA, pal.CYAN
+    text1_x = (w - FONT_WIDTH * len(text1)) // 2
+    text2_x = (w - FONT_WIDTH * len(text2)) // 2
+
+    # The static shapes in drawing order, each with the rows (first, last) it covers.
+    layers = (
+        (h // 3, h * 2 // 3, fill_rect, (drv, w // 6, h // 3, w * 2 // 3, h // 3, GREY)),
+        (0, h - 1, line, (drv, 0, 0, w - 1, h - 1, GREEN)),
+        (0, 14, rect, (drv, 0, 0, 15, 15, RED, True)),
+        (h - 15, h - 1, rect, (drv, w - 15, h - 15, 15, 15, BLUE, True)),
+        (h // 2, h // 2, hline, (drv, w // 8, h // 2, w * 3 // 4, MAGENTA)),
+        (h // 4, h * 3 // 4, vline, (drv, w // 2, h // 4, h // 2, CYAN)),
+        (h // 8, h // 8, pixel, (drv, w // 2, h * 1 // 8, WHITE)),
+        (h // 2 - h // 8, h // 2 + h // 8, ellipse, (drv, w // 2, h // 2, w // 4, h // 8, BLACK, True, 0b1111)),
+        (h // 2 - 8, h // 2 - 1, text_, (drv, text1, text1_x, h // 2 - 8, WHITE)),
+        (h // 2, h // 2 + 7, text_, (drv, text2, text2_x, h // 2, WHITE)),
+    )
+
+    # Vertical extent of the polygon relative to its y position
+    if isinstance(poly[0], int):
+        poly_ys = [poly[i] for i in range(1, len(poly), 2)]
+    else:
+        poly_ys = [point[1] for point in poly]
+    poly_top, poly_bottom = min(poly_ys), max(poly_ys)
+
+    y_range = range(h - 1, -1, -1) if animate else [h - 1]
+    first = True
     for y in y_range:
-        shapes.fill(display_drv, pal.BLACK)
-        shapes.poly(display_drv, 0, y, poly, pal.YELLOW, True)
-        shapes.fill_rect(
-            display_drv,
-            WIDTH // 6,
-            HEIGHT // 3,
-            WIDTH * 2 // 3,
-            HEIGHT // 3,
-            pal.GREY,
-        )
-        shapes.line(display_drv, 0, 0, WIDTH - 1, HEIGHT - 1, pal.GREEN)
-        shapes.rect(display_drv, 0, 0, 15, 15, pal.RED, True)
-        shapes.rect(display_drv, WIDTH - 15, HEIGHT - 15, 15, 15, pal.BLUE, True)
-        shapes.hline(display_drv, WIDTH // 8, HEIGHT // 2, WIDTH * 3 // 4, pal.MAGENTA)
-        shapes.vline(display_drv, WIDTH // 2, HEIGHT // 4, HEIGHT // 2, pal.CYAN)
-        shapes.pixel(display_drv, WIDTH // 2, HEIGHT * 1 // 8, pal.WHITE)
-        shapes.ellipse(
-            display_drv,
-            WIDTH // 2,
-            HEIGHT // 2,
-            WIDTH // 4,
-            HEIGHT // 8,
-            pal.BLACK,
-            True,
-            0b1111,
-        )
-        text(
-            display_drv, text1, (WIDTH - FONT_WIDTH * len(text1)) // 2, HEIGHT // 2 - 8, pal.WHITE
-        )
-        text(
-            display_drv, text2, (WIDTH - FONT_WIDTH * len(text2)) // 2, HEIGHT // 2, pal.WHITE
-        )
+        if first:
+            fill(drv, BLACK)
+            band_top, band_bottom = 0, h - 1
+            first = False
+        else:
+            # Only the polygon moves.  Clear the rows it covered last frame
+            # (one row lower) and this frame, instead of the whole screen.
+            band_top = max(y + poly_top, 0)
+            band_bottom = min(y + 1 + poly_bottom, h - 1)
+            fill_rect(drv, 0, band_top, w, band_bottom - band_top + 1, BLACK)
+        poly_(drv, 0, y, poly, YELLOW, True)
+        # Redraw every shape from the first one that overlaps the cleared band.
+        # Later shapes are redrawn too, because an earlier one may paint over them.
+        redraw = False
+        for first_row, last_row, func, args in layers:
+            if redraw or (first_row <= band_bottom and last_row >= band_top):
+                redraw = True
+                func(*args)
 
-    shapes.hline(display_drv, 0, 0, WIDTH, pal.BLACK)
-    shapes.vline(display_drv, 0, 0, HEIGHT, pal.BLACK)
+    hline(drv, 0, 0, w, BLACK)
+    vline(drv, 0, 0, h, BLACK)
 
 
 launch = lambda: main(animate=True)
@@ -26,7 +26,8 @@ class Events:
     JOYBUTTONDOWN = const(0x603)  # Joystick button pressed
     JOYBUTTONUP = const(0x604)  # Joystick button released
 
-    filter = [
+    # A set so the `event.type in Events.filter` checks on every poll are hashed lookups
+    filter = {
         QUIT,
         KEYDOWN,
         KEYUP,
@@ -34,7 +35,7 @@ class Events:
         MOUSEBUTTONDOWN,
         MOUSEBUTTONUP,
         MOUSEWHEEL,
-    ]
+    }
 
     # Event classes from PyGame
     Unknown = namedtuple("Common", "type")
@@ -60,7 +61,7 @@ class Events:
         Events.new_types(types, classes)
 
         # Optionally update the filter
-        Events.filter += [Events.KEYDOWN, Events.KEYUP]
+        Events.filter.update((Events.KEYDOWN, Events.KEYUP))
         ```
 
         Args:
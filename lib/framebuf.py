@@ -46,6 +46,28 @@ _FONT_HEIGHT = 8
 _FONT_SCALE = 1
 
 
+def _fill_bits(buffer, start, stop, mask, fill):
+    """Set the bits in ``mask`` of each byte in ``buffer[start:stop]`` to those of ``fill``."""
+    keep = ~mask & 0xFF
+    fill &= mask
+    for i in range(start, stop):
+        buffer[i] = (buffer[i] & keep) | fill
+
+
+def _mhmsb_mask(x, count):
+    """Return the MONO_HMSB bit mask of ``count`` (at most 8) pixels starting at column ``x``."""
+    mask = (0xFF00 >> count) & 0xFF
+    shift = x & 0x07
+    return ((mask >> shift) | (mask << (8 - shift))) & 0xFF
+
+
+def _gs2hmsb_mask(x, count):
+    """Return the GS2_HMSB bit mask of ``count`` (at most 4) pixels starting at column ``x``."""
+    mask = (1 << (count << 1)) - 1
+    shift = (x & 0b11) << 1
+    return ((mask << shift) | (mask >> (8 - shift))) & 0xFF
+
+
 class MVLSBFormat:
     """MVLSBFormat"""
 
@@ -70,27 +92,29 @@ class MVLSBFormat:
     @staticmethod
     def fill(framebuf, color):
         """completely fill/clear the buffer with a color"""
-        if color:
-            fill = 0xFF
-        else:
-            fill = 0x00
-        for i in range(len(framebuf._buffer)):  # pylint: disable=consider-using-enumerate
-            framebuf._buffer[i] = fill
+        fill = 0xFF if color else 0x00
+        framebuf._buffer[:] = bytes((fill,)) * len(framebuf._buffer)
 
     @staticmethod
     def fill_rect(framebuf, x, y, width, height, color):
         """Draw a rectangle at the given location, size and color. The ``fill_rect`` method draws
         both the outline and interior."""
         # pylint: disable=too-many-arguments
-        while height > 0:
-            index = (y >> 3) * framebuf._stride + x
+        buffer = framebuf._buffer
+        fill = 0xFF if color else 0x00
+        row = bytes((fill,)) * width
+        end = y + height
+        while y < end:
+            # Handle every row that falls in the same 8-row page at once
             offset = y & 0x07
-            for w_w in range(width):
-                framebuf._buffer[index + w_w] = (
-                    framebuf._buffer[index + w_w] & ~(0x01 << offset)
-                ) | ((color != 0) << offset)
-            y += 1
-            height -= 1
+            rows = min(8 - offset, end - y)
+            mask = ((1 << rows) - 1) << offset
+            index = (y >> 3) * framebuf._stride + x
+            if mask == 0xFF:
+                buffer[index : index + width] = row
+            else:
+                _fill_bits(buffer, index, index + width, mask, fill)
+            y += rows
 
 
 class MHLSBFormat:
@@ -121,25 +145,30 @@ class MHMSBFormat:
     @staticmethod
     def fill(framebuf, color):
         """completely fill/clear the buffer with a color"""
-        if color:
-            fill = 0xFF
-        else:
-            fill = 0x00
-        for i in range(len(framebuf._buffer)):  # pylint: disable=consider-using-enumerate
-            framebuf._buffer[i] = fill
+        fill = 0xFF if color else 0x00
+        framebuf._buffer[:] = bytes((fill,)) * len(framebuf._buffer)
 
     @staticmethod
     def fill_rect(framebuf, x, y, width, height, color):
         """Draw a rectangle at the given location, size and color. The ``fill_rect`` method draws
         both the outline and interior."""
         # pylint: disable=too-many-arguments
-        for _x in range(x, x + width):
-            offset = 7 - _x & 0x07
-            for _y in range(y, y + height):
-                index = (_y * framebuf._stride + _x) // 8
-                framebuf._buffer[index] = (framebuf._buffer[index] & ~(0x01 << offset)) | (
-                    (color != 0) << offset
-                )
+        buffer = framebuf._buffer
+        fill = 0xFF if color else 0x00
+        for _y in range(y, y + height):
+            start = _y * framebuf._stride + x
+            end = start + width - 1
+            first, last = start >> 3, end >> 3
+            if first == last:
+                _fill_bits(buffer, first, first + 1, _mhmsb_mask(x, width), fill)
+                continue
+            # set_pixel takes the bit from x, not from the buffer offset, so the masks must too
+            lead = _mhmsb_mask(x, 8 - (start & 0x07))
+            count = (end & 0x07) + 1
+            trail = _mhmsb_mask(x + width - count, count)
+            _fill_bits(buffer, first, first + 1, lead, fill)
+            buffer[first + 1 : last] = bytes((fill,)) * (last - first - 1)
+            _fill_bits(buffer, last, last + 1, trail, fill)
 
 
 class RGB565Format:
@@ -175,8 +204,8 @@ class RGB565Format:
             arr = np.frombuffer(framebuf._buffer, dtype=np.uint16)
             arr[:] = rgb565_color_int
         else:
-            for i in range(0, len(framebuf._buffer), 2):
-                framebuf._buffer[i : i + 2] = rgb565_color
+            pixels = len(framebuf._buffer) // 2
+            framebuf._buffer[: pixels * 2] = rgb565_color * pixels
 
     @staticmethod
     def fill_rect(framebuf, x, y, width, height, color):
@@ -192,11 +221,10 @@ class RGB565Format:
                     rgb565_color_int
                 )
         else:
-            for _y in range(2 * y, 2 * (y + height), 2):
-                offset2 = _y * framebuf._stride
-                for _x in range(2 * x, 2 * (x + width), 2):
-                    index = offset2 + _x
-                    framebuf._buffer[index : index + 2] = rgb565_color
+            row = rgb565_color * width
+            for _y in range(y, y + height):
+                index = (_y * framebuf._stride + x) * 2
+                framebuf._buffer[index : index + 2 * width] = row
 
 
 class GS2HMSBFormat:
@@ -228,21 +256,31 @@ class GS2HMSBFormat:
     @staticmethod
     def fill(framebuf, color):
         """completely fill/clear the buffer with a color"""
-        if color:
-            bits = color & 0b11
-            fill = (bits << 6) | (bits << 4) | (bits << 2) | (bits << 0)
-        else:
-            fill = 0x00
-
-        framebuf._buffer = [fill for i in range(len(framebuf._buffer))]
+        bits = color & 0b11
+        fill = (bits << 6) | (bits << 4) | (bits << 2) | (bits << 0)
+        framebuf._buffer[:] = bytes((fill,)) * len(framebuf._buffer)
 
     @staticmethod
     def fill_rect(framebuf, x, y, width, height, color):
         """Draw the outline and interior of a rectangle at the given location, size and color."""
         # pylint: disable=too-many-arguments
-        for _x in range(x, x + width):
-            for _y in range(y, y + height):
-                GS2HMSBFormat.set_pixel(framebuf, _x, _y, color)
+        buffer = framebuf._buffer
+        bits = color & 0b11
+        fill = (bits << 6) | (bits << 4) | (bits << 2) | bits
+        for _y in range(y, y + height):
+            start = _y * framebuf._stride + x
+            end = start + width - 1
+            first, last = start >> 2, end >> 2
+            if first == last:
+                _fill_bits(buffer, first, first + 1, _gs2hmsb_mask(x, width), fill)
+                continue
+            # set_pixel takes the shift from x, not from the buffer offset, so the masks must too
+            lead = _gs2hmsb_mask(x, 4 - (start & 0b11))
+            count = (end & 0b11) + 1
+            trail = _gs2hmsb_mask(x + width - count, count)
+            _fill_bits(buffer, first, first + 1, lead, fill)
+            buffer[first + 1 : last] = bytes((fill,)) * (last - first - 1)
+            _fill_bits(buffer, last, last + 1, trail, fill)
 
 
 class GS4HMSBFormat:
@@ -300,7 +338,11 @@ class FrameBuffer(BasicShapes):
 
     def fill_rect(self, x, y, w, h, c):
         """Draw a filled rectangle at the given location, size and color."""
-        self._format.fill_rect(self, x, y, w, h, c)
+        # Clip to the buffer like the native framebuf does
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + w, self.width), min(y + h, self.height)
+        if x2 > x1 and y2 > y1:
+            self._format.fill_rect(self, x1, y1, x2 - x1, y2 - y1, c)
         return Area(x, y, w, h)
 
     def pixel(self, x, y, c=None):
@@ -29,31 +29,34 @@ from framebuf import (
     GS8,
 )
 from primitives import ExtendedShapes, Area
+from sys import implementation
 import math
 
 
+# Bits per pixel for each framebuf format
+_COLOR_DEPTH = {
+    MONO_VLSB: 1,
+    MONO_HLSB: 1,
+    MONO_HMSB: 1,
+    RGB565: 16,
+    GS2_HMSB: 2,
+    GS4_HMSB: 4,
+    GS8: 8,
+}
+
+
 class FrameBuffer(_FrameBuffer, ExtendedShapes):
     def __init__(self, buffer, width, height, format, *args, **kwargs):
         super().__init__(buffer, width, height, format, *args, **kwargs)
         self.width = width
         self.height = height
-        
-        if format == MONO_VLSB:
-            self._color_depth = 1
-        elif format == MONO_HLSB:
-            self._color_depth = 1
-        elif format == MONO_HMSB:
-            self._color_depth = 1
-        elif format == RGB565:
-            self._color_depth = 16
-        elif format == GS2_HMSB:
-            self._color_depth = 2
-        elif format == GS4_HMSB:
-            self._color_depth = 4
-        elif format == GS8:
-            self._color_depth = 8
-        else:
+
+        try:
+            self._color_depth = _COLOR_DEPTH[format]
+        except KeyError:
             raise ValueError("invalid format")
+        self._fmt = format
+
     @property
     def color_depth(self):
         return self._color_depth
@@ -69,6 +72,8 @@ class FrameBuffer(_FrameBuffer, ExtendedShapes):
             height (int): Height in pixels
             c (int): 565 encoded color
         """
+        if w <= 0 or h <= 0:
+            return Area(x, y, max(w, 0), max(h, 0))
         super().fill_rect(x, y, w, h, c)
         return Area(x, y, w, h)
 
@@ -104,6 +109,8 @@ class FrameBuffer(_FrameBuffer, ExtendedShapes):
             w (int): Width in pixels
             c (int): 565 encoded color
         """
+        if w <= 0:
+            return Area(x, y, 0, 1)
         super().hline(x, y, w, c)
         return Area(x, y, w, 1)
 
@@ -117,6 +124,8 @@ class FrameBuffer(_FrameBuffer, ExtendedShapes):
             h (int): Height in pixels
             c (int): 565 encoded color
         """
+        if h <= 0:
+            return Area(x, y, 1, 0)
         super().vline(x, y, h, c)
         return Area(x, y, 1, h)
 
@@ -146,6 +155,8 @@ class FrameBuffer(_FrameBuffer, ExtendedShapes):
             c (int): 565 encoded color
             f (bool): Fill the rectangle (default: False)
         """
+        if w <= 0 or h <= 0:
+            return Area(x, y, max(w, 0), max(h, 0))
         super().rect(x, y, w, h, c, f)
         return Area(x, y, w, h)
 
@@ -163,7 +174,15 @@ class FrameBuffer(_FrameBuffer, ExtendedShapes):
             m (int): Bitmask to determine which quadrants to draw (default: 0b1111)
         """
         super().ellipse(x, y, rx, ry, c, f, m)
-        return Area(x - rx, y - ry, 2 * rx, 2 * ry)
+        if not m & 0b1111:
+            return Area(x, y, 0, 0)
+        # Only include the halves that have a quadrant drawn in them.
+        # Quadrants are numbered counterclockwise with Q1 (bit 0) being top right.
+        x1 = x - rx if m & 0b0110 else x
+        x2 = x + rx if m & 0b1001 else x
+        y1 = y - ry if m & 0b0011 else y
+        y2 = y + ry if m & 0b1100 else y
+        return Area(x1, y1, x2 - x1 + 1, y2 - y1 + 1)
 
     def poly(self, x, y, coords, c, f=False):
         """
@@ -177,22 +196,51 @@ class FrameBuffer(_FrameBuffer, ExtendedShapes):
             f (bool): Fill the polygon (default: False)
         """
         super().poly(x, y, coords, c, f)
-        # Convert the coords to a list of x, y tuples if it is not already
-        if isinstance(coords, list):
-            vertices = coords
-        elif isinstance(coords, tuple):
-            vertices = list(coords)
+        # Find the min and max x and y values in a single pass, without building
+        # intermediate lists.  coords is either a list or tuple of (x, y) points
+        # or a flat array of x, y values.
+        if isinstance(coords[0], (list, tuple)):
+            points = iter(coords)
         else:
             # Check that the coords array has an even number of elements
             if len(coords) % 2 != 0:
                 raise ValueError("coords must have an even number of elements")
-            vertices = [(coords[i], coords[i + 1]) for i in range(0, len(coords), 2)]
-        # Find the min and max x and y values
-        min_x = min([v[0] for v in vertices])
-        min_y = min([v[1] for v in vertices])
-        max_x = max([v[0] for v in vertices])
-        max_y = max([v[1] for v in vertices])
-        return Area(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+            points = ((coords[i], coords[i + 1]) for i in range(0, len(coords), 2))
+        min_x, min_y = max_x, max_y = next(points)
+        for px, py in points:
+            if px < min_x:
+                min_x = px
+            elif px > max_x:
+                max_x = px
+            if py < min_y:
+                min_y = py
+            elif py > max_y:
+                max_y = py
+        return Area(x + min_x, y + min_y, max_x - min_x + 1, max_y - min_y + 1)
+
+    if implementation.name == "micropython":
+
+        def blit_rect(self, buf, x, y, w, h):
+            """
+            Blit a rectangular area from a buffer to the FrameBuffer.
+
+            Uses the compiled framebuf blit, which copies the rows in C, instead
+            of the Python implementation in primitives.  buf must be in the same
+            format as the FrameBuffer.
+
+            Args:
+                buf (buffer): Buffer containing the data to blit
+                x (int): Top left corner x coordinate
+                y (int): Top left corner y coordinate
+                w (int): Width in pixels
+                h (int): Height in pixels
+            """
+            if x < 0 or y < 0 or x + w > self.width or y + h > self.height:
+                raise ValueError("The provided x, y, w, h values are out of range")
+            # A (buffer, width, height, format) tuple saves creating a FrameBuffer
+            # for the source; blit raises ValueError if buf is too small.
+            self.blit((buf, w, h, self._fmt), x, y)
+            return Area(x, y, w, h)
 
     def text(self, first_arg, *args, **kwargs):
         if isinstance(first_arg, (str, bytes)):
@@ -253,6 +253,13 @@ class _BaseDisplay(Broker, DisplayPrimitives):
     def set_render_mode_full(self, render_mode_full=False):
         return
 
+    def refresh(self):
+        """
+        Show any changes that haven't been shown yet.  Displays that update
+        immediately don't need to do anything.
+        """
+        return
+
     @property
     def power(self):
         return -1
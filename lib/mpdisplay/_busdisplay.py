@@ -43,6 +43,9 @@ _SLPOUT = const(0x11)
 _VSCRDEF = const(0x33)
 _VSCSAD = const(0x37)
 
+# Maximum number of pixels buffered at once by fill_rect
+_FILL_BUF_PIXELS = const(1024)
+
 # fmt: off
 
 # MIPI DCS MADCTL bits
@@ -319,15 +322,27 @@ class BusDisplay(_BaseDisplay):
         :param color: The color to fill the rectangle with, encoded as a 565 color.
         :type color: int
         """
+        if width <= 0 or height <= 0:
+            return Area(x, y, max(width, 0), max(height, 0))
         color = color & 0xFFFF  # Ensure color is 16-bit for circuitpython
-        if height > width:
-            raw_data = struct.pack("<H", color) * height
-            for col in range(x, x + width):
-                self.blit_rect(memoryview(raw_data[:]), col, y, 1, height)
-        else:
-            raw_data = struct.pack("<H", color) * width
-            for row in range(y, y + height):
-                self.blit_rect(memoryview(raw_data[:]), x, row, width, 1)
+        if self.requires_byte_swap:
+            # Swap once here instead of letting blit_rect swap every band in place
+            color = ((color & 0xFF) << 8) | (color >> 8)
+
+        # Send the rectangle in bands of whole rows.  Every band has the same
+        # contents, so one buffer is packed once and reused for all of them.
+        rows = max(1, min(height, _FILL_BUF_PIXELS // width))
+        raw_data = memoryview(struct.pack("<H", color) * (width * rows))
+        x1 = x + self._colstart
+        x2 = x1 + width - 1
+        y1 = y + self._rowstart
+        y_end = y1 + height
+        while y1 < y_end:
+            band = min(rows, y_end - y1)
+            y2 = y1 + band - 1
+            self.set_window(x1, y1, x2, y2)
+            self._tx_color(self._write_ram_command, raw_data[: width * band * 2], x1, y1, x2, y2)
+            y1 += band
         return Area(x, y, width, height)
 
     def deinit(self):
@@ -369,7 +384,9 @@ class BusDisplay(_BaseDisplay):
             super().vscsad(vssa)
             if vssa is False:
                 vssa = 0
-            self.set_params(_VSCSAD, struct.pack(">H", vssa))
+            self._param_buf[0] = (vssa >> 8) & 0xFF
+            self._param_buf[1] = vssa & 0xFF
+            self.set_params(_VSCSAD, self._param_mv[:2])
         else:
             return super().vscsad()
 
@@ -465,9 +482,8 @@ class BusDisplay(_BaseDisplay):
                     elif sys.implementation.name == "circuitpython":
                         self._backlight_pin.value = value > 0.5
             elif self._brightness_command is not None:
-                self.set_params(
-                    self._brightness_command, struct.pack("B", int(value * 255))
-                )
+                self._param_buf[0] = int(value * 255)
+                self.set_params(self._brightness_command, self._param_mv[:1])
 
     def reset(self):
         """
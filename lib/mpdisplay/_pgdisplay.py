@@ -9,6 +9,13 @@ PGDisplay class for CPython.
 from . import _BaseDisplay, Events, Devices, Area
 import pygame as pg
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_MAX_DIRTY = 16  # Queued rectangles before refresh() falls back to one full redraw
+
 
 class PGDisplay(_BaseDisplay):
     '''
@@ -25,6 +32,7 @@ class PGDisplay(_BaseDisplay):
         title="MPDisplay",
         scale=1.0,
         window_flags=pg.SHOWN,
+        auto_refresh=True,
     ):
         """
         Initializes the display instance with the given parameters.
@@ -43,6 +51,9 @@ class PGDisplay(_BaseDisplay):
         :type scale: float
         :param window_flags: The flags for creating the display window (default is pg.SHOWN).
         :type window_flags: int
+        :param auto_refresh: Whether to update the window after every change (default is True).
+            If False, changes are collected and shown when .refresh() is called.
+        :type auto_refresh: bool
         """
         super().__init__()
         self._width = width
@@ -54,7 +65,8 @@ class PGDisplay(_BaseDisplay):
         self._scale = scale
         self.touch_scale = scale
         self._buffer = None
-
+        self.auto_refresh = auto_refresh
+        self._dirty = []  # Rectangles changed since the last refresh; None means the whole buffer
 
         self._bytes_per_pixel = color_depth // 8
 
@@ -93,12 +105,38 @@ class PGDisplay(_BaseDisplay):
         :type buffer: bytearray
         """
 
+        if w <= 0 or h <= 0:
+            return Area(x, y, max(w, 0), max(h, 0))
         blitRect = pg.Rect(x, y, w, h)
-        for i in range(h):
-            for j in range(w):
-                pixel_index = (i * w + j) * self._bytes_per_pixel
-                color = self.color_rgb(buffer[pixel_index:pixel_index + self._bytes_per_pixel])
-                self._buffer.set_at((x + j, y + i), color)
+        if (
+            self.color_depth == 16
+            and np is not None
+            and self._buffer.get_rect().contains(blitRect)
+        ):
+            # Write the RGB565 words straight into the back buffer's pixels.  surfarray
+            # indexes [x, y], so the (h, w) source array is transposed.
+            # Rects that are partly off the surface go through Surface.blit below, which clips.
+            src = np.frombuffer(buffer, dtype="<u2").reshape(h, w)
+            dst = pg.surfarray.pixels2d(self._buffer)
+            dst[x:x + w, y:y + h] = src.T
+            del dst  # Unlock the surface
+        else:
+            if self.color_depth == 16:
+                # The buffer holds little endian RGB565, the native layout of a 16-bit pygame
+                # Surface, so the bytes are copied in as-is, one row at a time if the pitch is padded.
+                src = pg.Surface((w, h), depth=16)
+                row_bytes = w * 2
+                pitch = src.get_pitch()
+                view = src.get_buffer()
+                if pitch == row_bytes:
+                    view.write(bytes(buffer), 0)
+                else:
+                    for row in range(h):
+                        view.write(bytes(buffer[row * row_bytes:(row + 1) * row_bytes]), row * pitch)
+                del view
+            else:
+                src = pg.image.frombuffer(buffer, (w, h), "RGB")
+            self._buffer.blit(src, blitRect)
         self._show(blitRect)
         return Area(x, y, w, h)
 
@@ -120,6 +158,8 @@ class PGDisplay(_BaseDisplay):
         :param color: The color of the rectangle.
         :type color: int
         """
+        if w <= 0 or h <= 0:
+            return Area(x, y, max(w, 0), max(h, 0))
         fillRect = pg.Rect(x, y, w, h)
         self._buffer.fill(self.color_rgb(color), fillRect)
         self._show(fillRect)
@@ -200,24 +240,64 @@ class PGDisplay(_BaseDisplay):
 
     ############### Class Specific Methods ##############
 
+    def refresh(self):
+        """
+        Show all changes made since the last refresh.  Only needed if auto_refresh is False.
+        """
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        self._dirty = []
+        # The scroll path and non-integer scales always render the whole buffer, so only do it once
+        if None in dirty or self._vssa is not False or self._scale != int(self._scale):
+            pg.display.update(self._render())
+        else:
+            pg.display.update([self._render(rect) for rect in dirty])
+
     def _show(self, renderRect=None):
         """
         Show the display.  Automatically called after blitting or filling the display.
+        If auto_refresh is False, the rectangle is queued until .refresh() is called.
 
         :param renderRect: The rectangle to render (default is None).
         :type renderRect: pg.Rect
         """
+        if self.auto_refresh:
+            pg.display.update(self._render(renderRect))
+        elif not self._dirty or self._dirty[0] is not None:  # Nothing to add once a full redraw is queued
+            if renderRect is None or len(self._dirty) >= _MAX_DIRTY:
+                self._dirty = [None]  # Redraw everything on the next refresh
+            else:
+                self._dirty.append(renderRect)
+
+    def _render(self, renderRect=None):
+        """
+        Copy the buffer to the window, scaling it and applying the vertical scroll.
+
+        :param renderRect: The rectangle to render (default is None, the whole buffer).
+        :type renderRect: pg.Rect
+        :return: The area of the window that was updated.
+        :rtype: pg.Rect
+        """
         s = self._scale
-        buffer = pg.transform.scale_by(self._buffer, s)
-        if (y_start := self.vscsad()) == False:
+        if (y_start := self._vssa) is False:
             if renderRect is not None:
-                x, y, w, h = renderRect
-                renderRect = pg.Rect(x*s, y*s, w*s, h*s)
-                dest = renderRect
-            else:
-                dest = (0, 0)
-            self._window.blit(buffer, dest, renderRect)
+                # Only scale the part of the buffer that changed
+                renderRect = renderRect.clip(self._buffer.get_rect())
+                if not renderRect.w or not renderRect.h:
+                    return renderRect  # Entirely off the surface, so there is nothing to draw
+                if s == 1:
+                    return self._window.blit(self._buffer, renderRect, renderRect)
+                if s == int(s):
+                    # At integer scales each buffer pixel covers whole window pixels, so the
+                    # scaled part lines up with a full render.  Other scales leave seams.
+                    x, y, w, h = renderRect
+                    buffer = pg.transform.scale_by(self._buffer.subsurface(renderRect), s)
+                    return self._window.blit(buffer, (x*s, y*s))
+            buffer = self._buffer if s == 1 else pg.transform.scale_by(self._buffer, s)
+            return self._window.blit(buffer, (0, 0))
         else:
+            buffer = self._buffer if s == 1 else pg.transform.scale_by(self._buffer, s)
             # Ignore renderRect and render the entire buffer to the window in four steps
             y_start *= s
             tfa = self._tfa * s
@@ -230,20 +310,22 @@ class PGDisplay(_BaseDisplay):
                 self._window.blit(buffer, tfaRect, tfaRect)
 
             vsaTopHeight = vsa + tfa - y_start
-            vsaTopSrcRect = pg.Rect(0, y_start, width, vsaTopHeight)
-            vsaTopDestRect = pg.Rect(0, tfa, width, vsaTopHeight)
-            self._window.blit(buffer, vsaTopDestRect, vsaTopSrcRect)
+            if vsaTopHeight > 0:
+                vsaTopSrcRect = pg.Rect(0, y_start, width, vsaTopHeight)
+                vsaTopDestRect = pg.Rect(0, tfa, width, vsaTopHeight)
+                self._window.blit(buffer, vsaTopDestRect, vsaTopSrcRect)
 
             vsaBtmHeight = vsa - vsaTopHeight
-            vsaBtmSrcRect = pg.Rect(0, tfa, width, vsaBtmHeight)
-            vsaBtmDestRect = pg.Rect(0, tfa + vsaTopHeight, width, vsaBtmHeight)
-            self._window.blit(buffer, vsaBtmDestRect, vsaBtmSrcRect)
+            if vsaBtmHeight > 0:
+                vsaBtmSrcRect = pg.Rect(0, tfa, width, vsaBtmHeight)
+                vsaBtmDestRect = pg.Rect(0, tfa + vsaTopHeight, width, vsaBtmHeight)
+                self._window.blit(buffer, vsaBtmDestRect, vsaBtmSrcRect)
 
             if bfa > 0:
                 bfaRect = pg.Rect(0, tfa + vsa, width, bfa)
                 self._window.blit(buffer, bfaRect, bfaRect)
 
-        pg.display.flip()
+        return self._window.get_rect()
 
 
 class PGEventQueue():
@@ -23,8 +23,23 @@ if implementation.name == 'cpython':
     import ctypes
     is_cpython = True
 else:
+    import struct
     is_cpython = False
 
+_TILE_SIZE = 64  # Blits larger than one tile are uploaded to the texture tile by tile
+_MAX_DIRTY = 16  # Queued rectangles before refresh() falls back to one full redraw
+
+# (left, middle, right) button states for each combination of the mouse button mask bits
+_BUTTON_MASK = SDL_BUTTON_LMASK | SDL_BUTTON_MMASK | SDL_BUTTON_RMASK
+_BUTTON_STATES = tuple(
+    (
+        1 if state & SDL_BUTTON_LMASK else 0,
+        1 if state & SDL_BUTTON_MMASK else 0,
+        1 if state & SDL_BUTTON_RMASK else 0,
+    )
+    for state in range(_BUTTON_MASK + 1)
+)
+
 
 def retcheck(retvalue):
     # Check the return value of an SDL function and raise an exception if it's not 0
@@ -50,6 +65,7 @@ class SDL2Display(_BaseDisplay):
         render_flags=SDL_RENDERER_ACCELERATED | SDL_RENDERER_PRESENTVSYNC,
         x=SDL_WINDOWPOS_CENTERED,
         y=SDL_WINDOWPOS_CENTERED,
+        auto_refresh=True,
     ):
         """
         Initializes the display instance with the given parameters.
@@ -74,6 +90,9 @@ class SDL2Display(_BaseDisplay):
         :type x: int
         :param y: The y-coordinate of the display window's position (default is SDL_WINDOWPOS_CENTERED).
         :type y: int
+        :param auto_refresh: Whether to present the window after every change (default is True).
+            If False, changes are collected and presented when .refresh() is called.
+        :type auto_refresh: bool
         """
         super().__init__()
         self._width = width
@@ -84,6 +103,9 @@ class SDL2Display(_BaseDisplay):
         self._window_flags = window_flags
         self._scale = scale
         self._buffer = None
+        self._target = None  # Current render target; None is the window
+        self.auto_refresh = auto_refresh
+        self._dirty = []  # Rectangles changed since the last refresh; None means the whole texture
 
         # Determine the pixel format
         if color_depth == 32:
@@ -137,19 +159,35 @@ class SDL2Display(_BaseDisplay):
         :param buffer: The buffer to blit_rect to the display.
         :type buffer: bytearray
         """
+        if w <= 0 or h <= 0:
+            return Area(x, y, max(w, 0), max(h, 0))
         pitch = int(w * self.color_depth // 8)
         if len(buffer) != pitch * h:
             raise ValueError("Buffer size does not match dimensions")
         blitRect = SDL_Rect(x, y, w, h)
         if is_cpython:
-            if type(buffer) is memoryview:
-                buffer_array = (ctypes.c_ubyte * len(buffer.obj)).from_buffer(buffer.obj)
-            elif type(buffer) is bytearray:
-                buffer_array = (ctypes.c_ubyte * len(buffer)).from_buffer(buffer)
+            if isinstance(buffer, ctypes.Array):
+                buffer_addr = ctypes.addressof(buffer)
+            elif type(buffer) in (memoryview, bytearray):
+                # A single c_char is enough to get the address of the first byte.  Unlike
+                # wrapping buffer.obj, it also honors the offset of a sliced memoryview.
+                buffer_addr = ctypes.addressof(ctypes.c_char.from_buffer(buffer))
             else:
                 raise ValueError(f"Buffer is of type {type(buffer)} instead of memoryview or bytearray")
-            buffer_ptr = ctypes.c_void_p(ctypes.addressof(buffer_array))
-            retcheck(SDL_UpdateTexture(self._buffer, blitRect, buffer_ptr, pitch))
+            if w * h > _TILE_SIZE * _TILE_SIZE:
+                # Upload in row-major order of tiles, pointing into the source buffer with its full pitch
+                bytes_per_pixel = self.color_depth // 8
+                tileRect = SDL_Rect()
+                for ty in range(0, h, _TILE_SIZE):
+                    tileRect.y = y + ty
+                    tileRect.h = min(_TILE_SIZE, h - ty)
+                    for tx in range(0, w, _TILE_SIZE):
+                        tileRect.x = x + tx
+                        tileRect.w = min(_TILE_SIZE, w - tx)
+                        tile_ptr = ctypes.c_void_p(buffer_addr + ty * pitch + tx * bytes_per_pixel)
+                        retcheck(SDL_UpdateTexture(self._buffer, tileRect, tile_ptr, pitch))
+            else:
+                retcheck(SDL_UpdateTexture(self._buffer, blitRect, ctypes.c_void_p(buffer_addr), pitch))
         else:
             retcheck(SDL_UpdateTexture(self._buffer, blitRect, buffer, pitch))
         self._show(blitRect)
@@ -173,13 +211,18 @@ class SDL2Display(_BaseDisplay):
         :param color: The color of the rectangle.
         :type color: int
         """
-        fillRect = SDL_Rect(x, y, w, h)
+        if w <= 0 or h <= 0:
+            return Area(x, y, max(w, 0), max(h, 0))
         r, g, b = self.color_rgb(color)
 
-        retcheck(SDL_SetRenderTarget(self._renderer, self._buffer))  # Set the render target to the texture
+        self._set_target(self._buffer)  # Draw on the texture
         retcheck(SDL_SetRenderDrawColor(self._renderer, r, g, b, 255))  # Set the color to fill the rectangle
-        retcheck(SDL_RenderFillRect(self._renderer, fillRect))  # Fill the rectangle on the texture
-        retcheck(SDL_SetRenderTarget(self._renderer, None))  # Reset the render target back to the window
+        if x <= 0 and y <= 0 and x + w >= self.width and y + h >= self.height:
+            fillRect = None
+            retcheck(SDL_RenderClear(self._renderer))  # The rectangle covers the whole texture
+        else:
+            fillRect = SDL_Rect(x, y, w, h)
+            retcheck(SDL_RenderFillRect(self._renderer, fillRect))  # Fill the rectangle on the texture
         self._show(fillRect)
         return Area(x, y, w, h)
 
@@ -206,6 +249,7 @@ class SDL2Display(_BaseDisplay):
         :type bfa: int
         """
         super().vscrdef(tfa, vsa, bfa)
+        self._update_scroll_rects()
         self._show()
 
     def vscsad(self, vssa=None):
@@ -217,6 +261,7 @@ class SDL2Display(_BaseDisplay):
         """
         if vssa is not None:
             super().vscsad(vssa)
+            self._update_scroll_rects()
             self._show()
         else:
             return super().vscsad()
@@ -257,7 +302,7 @@ class SDL2Display(_BaseDisplay):
                     raise RuntimeError(f"{SDL_GetError()}")
 
                 retcheck(SDL_SetTextureBlendMode(tempBuffer, SDL_BLENDMODE_NONE))
-                retcheck(SDL_SetRenderTarget(self._renderer, tempBuffer))
+                self._set_target(tempBuffer)
                 if abs(angle) != 180:
                     dstrect = SDL_Rect(
                         (self.height - self.width) // 2,
@@ -268,10 +313,11 @@ class SDL2Display(_BaseDisplay):
                 else:
                     dstrect = None
                 retcheck(SDL_RenderCopyEx(self._renderer, self._buffer, None, dstrect, angle, None, 0))
-                retcheck(SDL_SetRenderTarget(self._renderer, None))
+                self._set_target(None)
                 retcheck(SDL_DestroyTexture(self._buffer))
                 self._buffer = tempBuffer
             else:
+                self._set_target(None)  # Don't leave a destroyed texture as the target
                 retcheck(SDL_DestroyTexture(self._buffer))
                 self._buffer = SDL_CreateTexture(self._renderer, self._px_format, SDL_TEXTUREACCESS_TARGET, self.height, self.width)
                 if not self._buffer:
@@ -288,36 +334,97 @@ class SDL2Display(_BaseDisplay):
 
     ############### Class Specific Methods ##############
 
+    def refresh(self):
+        """
+        Present all changes made since the last refresh.  Only needed if auto_refresh is False.
+        """
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        self._dirty = []
+        self._set_target(None)  # Render to the window
+        # The scroll path always renders the whole texture, so only do it once
+        if None in dirty or self._vssa is not False:
+            self._render()
+        else:
+            for rect in dirty:
+                self._render(rect)
+        retcheck(SDL_RenderPresent(self._renderer))
+
     def _show(self, renderRect=None):
         """
         Show the display.  Automatically called after blitting or filling the display.
+        If auto_refresh is False, the rectangle is queued until .refresh() is called.
 
         :param renderRect: The rectangle to render (default is None).
         :type renderRect: SDL_Rect
         """
-        if (y_start := self.vscsad()) == False:
+        if self.auto_refresh:
+            self._set_target(None)  # Render to the window
+            self._render(renderRect)
+            retcheck(SDL_RenderPresent(self._renderer))
+        elif not self._dirty or self._dirty[0] is not None:  # Nothing to add once a full redraw is queued
+            if renderRect is None or len(self._dirty) >= _MAX_DIRTY:
+                self._dirty = [None]  # Redraw everything on the next refresh
+            else:
+                self._dirty.append(renderRect)
+
+    def _set_target(self, target):
+        """
+        Set the render target, skipping the call if it is already set.  Switching targets
+        flushes the renderer on some backends, so the target is left in place until a
+        different one is needed.  blit_rect updates the texture directly and needs neither.
+
+        :param target: The texture to render to, or None for the window.
+        :type target: SDL_Texture
+        """
+        if target != self._target:
+            retcheck(SDL_SetRenderTarget(self._renderer, target))
+            self._target = target
+
+    def _render(self, renderRect=None):
+        """
+        Copy the texture to the window, applying the vertical scroll.
+
+        :param renderRect: The rectangle to render (default is None, the whole texture).
+        :type renderRect: SDL_Rect
+        """
+        if self._vssa is False:
             retcheck(SDL_RenderCopy(self._renderer, self._buffer, renderRect, renderRect))
         else:
-            # Ignore renderRect and render the entire texture to the window in four steps
-            if self._tfa > 0:
-                tfaRect = SDL_Rect(0, 0, self.width, self._tfa)
-                retcheck(SDL_RenderCopy(self._renderer, self._buffer, tfaRect, tfaRect))
+            # Ignore renderRect and render the entire texture to the window in up to four steps
+            for srcRect, dstRect in self._scroll_rects:
+                retcheck(SDL_RenderCopy(self._renderer, self._buffer, srcRect, dstRect))
 
-            vsaTopHeight = self._vsa + self._tfa - y_start
+    def _update_scroll_rects(self):
+        """
+        Build the (source, destination) rectangle pairs _render uses to apply the vertical scroll.
+        Called whenever the scroll definition or start address changes, so _render doesn't have
+        to create new SDL_Rects on every frame.
+        """
+        self._scroll_rects = []
+        if (y_start := self._vssa) is False:
+            return
+
+        if self._tfa > 0:
+            tfaRect = SDL_Rect(0, 0, self.width, self._tfa)
+            self._scroll_rects.append((tfaRect, tfaRect))
+
+        vsaTopHeight = self._vsa + self._tfa - y_start
+        if vsaTopHeight > 0:
             vsaTopSrcRect = SDL_Rect(0, y_start, self.width, vsaTopHeight)
             vsaTopDestRect = SDL_Rect(0, self._tfa, self.width, vsaTopHeight)
-            retcheck(SDL_RenderCopy(self._renderer, self._buffer, vsaTopSrcRect, vsaTopDestRect))
+            self._scroll_rects.append((vsaTopSrcRect, vsaTopDestRect))
 
-            vsaBtmHeight = self._vsa - vsaTopHeight
+        vsaBtmHeight = self._vsa - vsaTopHeight
+        if vsaBtmHeight > 0:
             vsaBtmSrcRect = SDL_Rect(0, self._tfa, self.width, vsaBtmHeight)
             vsaBtmDestRect = SDL_Rect(0, self._tfa + vsaTopHeight, self.width, vsaBtmHeight)
-            retcheck(SDL_RenderCopy(self._renderer, self._buffer, vsaBtmSrcRect, vsaBtmDestRect))
-
-            if self._bfa > 0:
-                bfaRect = SDL_Rect(0, self._tfa + self._vsa, self.width, self._bfa)
-                retcheck(SDL_RenderCopy(self._renderer, self._buffer, bfaRect, bfaRect))
+            self._scroll_rects.append((vsaBtmSrcRect, vsaBtmDestRect))
 
-        retcheck(SDL_RenderPresent(self._renderer))
+        if self._bfa > 0:
+            bfaRect = SDL_Rect(0, self._tfa + self._vsa, self.width, self._bfa)
+            self._scroll_rects.append((bfaRect, bfaRect))
 
 
 class SDL2EventQueue():
@@ -342,17 +449,15 @@ class SDL2EventQueue():
                 if self._event.type in Events.filter:
                     return self._convert(SDL_Event(self._event))
             else:
-                if int.from_bytes(self._event[:4], 'little') in Events.filter:
+                if struct.unpack_from("<I", self._event)[0] in Events.filter:
                     return self._convert(SDL_Event(self._event))
         return None
 
     @staticmethod
     def _convert(e):
         if e.type == SDL_MOUSEMOTION:
-            l = 1 if e.motion.state & SDL_BUTTON_LMASK else 0
-            m = 1 if e.motion.state & SDL_BUTTON_MMASK else 0
-            r = 1 if e.motion.state & SDL_BUTTON_RMASK else 0
-            evt = Events.Motion(e.type, (e.motion.x, e.motion.y), (e.motion.xrel, e.motion.yrel), (l, m, r), e.motion.which != 0, e.motion.windowID)
+            buttons = _BUTTON_STATES[e.motion.state & _BUTTON_MASK]
+            evt = Events.Motion(e.type, (e.motion.x, e.motion.y), (e.motion.xrel, e.motion.yrel), buttons, e.motion.which != 0, e.motion.windowID)
         elif e.type in (SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP):
             evt = Events.Button(e.type, (e.button.x, e.button.y), e.button.button, e.button.which != 0, e.button.windowID)
         elif e.type == SDL_MOUSEWHEEL:
@@ -1,5 +1,8 @@
 
 class Area:
+    # No per-instance __dict__, since every drawing method creates one of these
+    __slots__ = ("_x", "_y", "_w", "_h")
+
     def __init__(self, x, y, w, h):
         self._x = x
         self._y = y
@@ -8,7 +8,6 @@ https://github.com/spacerace/romfont
 """
 
 import os
-import struct
 from ._area import Area
 
 # Default font file to use if none is specified.
@@ -147,33 +146,38 @@ class BinFont:
         # if x < -self.font_width or x >= canvas.width or \
         #   y < -self.font_height or y >= canvas.height:
         #    return
-        # Go through each row of the character.
-        for char_y in range(self._font_height):
-            # Grab the byte for the current row of font data.
-            self._font.seek((ord(char) * self._font_height) + char_y)
-            try:
-                line = struct.unpack("B", self._font.read(1))[0]
-            except RuntimeError:
-                continue  # maybe character isnt there? go to next
-            # Go through each column in the row byte.
-            for char_x in range(self.font_width):
-                # Draw a pixel for each bit that's flipped on.
-                if (line >> (self.font_width - char_x - 1)) & 0x1:
-                    canvas.fill_rect(
-                        (
-                            x + char_x * scale
-                            if not inverted
-                            else x + (self._font_width - char_x - 1) * scale
-                        ),
-                        (
-                            y + char_y * scale
-                            if not inverted
-                            else y + (self._font_height - char_y - 1) * scale
-                        ),
-                        scale,
-                        scale,
-                        color,
-                    )
+        font_width = self._font_width
+        # Read all the rows of the character at once.  Characters past the end
+        # of a 128 character font file come back short and draw nothing.
+        self._font.seek(ord(char) * self._font_height)
+        rows = self._font.read(self._font_height)
+        for char_y, line in enumerate(rows):
+            row_y = (
+                y + char_y * scale
+                if not inverted
+                else y + (self._font_height - char_y - 1) * scale
+            )
+            # Draw each horizontal run of flipped on bits with a single fill_rect
+            # instead of one per pixel.
+            char_x = 0
+            while char_x < font_width:
+                if not (line >> (font_width - char_x - 1)) & 0x1:
+                    char_x += 1
+                    continue
+                run_start = char_x
+                while char_x < font_width and (line >> (font_width - char_x - 1)) & 0x1:
+                    char_x += 1
+                canvas.fill_rect(
+                    (
+                        x + run_start * scale
+                        if not inverted
+                        else x + (font_width - char_x) * scale
+                    ),
+                    row_y,
+                    (char_x - run_start) * scale,
+                    scale,
+                    color,
+                )
         return Area(x, y, self._font_width * scale, self._font_height * scale)
 
     def text(self, canvas, string, x, y, color, scale=1, inverted=False):
@@ -13,39 +13,72 @@ from ._basic_shapes import (
     ellipse,
     poly,
 )
+from sys import implementation
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if implementation.name == "micropython":
+    from ._viper import _blit_rows
+else:
+    _blit_rows = None
+
 
 def arc(canvas, x, y, r, a0, a1, c, f=False):
     resolution = 60
     a0 = math.radians(a0)
     a1 = math.radians(a1)
+    start = int(a0 * resolution)
+    stop = int(a1 * resolution)
+    d = r + r
+    if start == stop:
+        # Zero length, or too short to take a step, so there are no segments to draw
+        return Area(x - r, y - r, d, d)
     x0 = x + int(r * math.cos(a0))
     y0 = y + int(r * math.sin(a0))
     if a1 > a0:
-        arc_range = range(int(a0 * resolution), int(a1 * resolution))
+        arc_range = range(start, stop)
+        step = 1 / resolution
     else:
-        arc_range = range(int(a0 * resolution), int(a1 * resolution), -1)
+        arc_range = range(start, stop, -1)
+        step = -1 / resolution
 
+    # Rotate the radius vector one step at a time instead of calling cos and sin for every step
+    cs = math.cos(step)
+    sn = math.sin(step)
+    px = r * math.cos(start / resolution)
+    py = r * math.sin(start / resolution)
     for a in arc_range:
-        ar = a / resolution
-        x1 = x + int(r * math.cos(ar))
-        y1 = y + int(r * math.sin(ar))
-        line(canvas, x0, y0, x1, y1, c)
-        x0 = x1
-        y0 = y1
-    return Area(x - r, y - r, r * 2, r * 2)  # Marks the whole 360 degrees of the circle
+        if a == 0:
+            px, py = r, 0  # Exact at 0 degrees, where int() would truncate a drifted r - 1e-14
+        x1 = x + int(px)
+        y1 = y + int(py)
+        # Most steps land on the pixel the last segment ended on, so only draw the
+        # segments that go somewhere.  The first one is always drawn in case it is the only one.
+        if x1 != x0 or y1 != y0 or a == start:
+            line(canvas, x0, y0, x1, y1, c)
+            x0 = x1
+            y0 = y1
+        px, py = px * cs - py * sn, px * sn + py * cs
+    return Area(x - r, y - r, d, d)  # Marks the whole 360 degrees of the circle
 
 def circle(canvas, x, y, r, c, f=False, m=0b1111):
     ellipse(canvas, x, y, r, r, c, f, m)
-    return Area(x - r, y - r, r * 2, r * 2)
+    d = r + r
+    return Area(x - r, y - r, d, d)
 
 def round_rect(canvas, x, y, w, h, r, c, f=False, m=0b1111):
-    if w < 2 * r:
-        r = w // 2
-    if h < 2 * r:
-        r = h // 2
-    ellipse(canvas, x + w // 2, y + h // 2, r, r, c, f, m, w, h)
+    half_w = w >> 1
+    half_h = h >> 1
+    # Equivalent to shrinking r when w < 2 * r, then when h < 2 * r
+    if r > half_w:
+        r = half_w
+    if r > half_h:
+        r = half_h
+    ellipse(canvas, x + half_w, y + half_h, r, r, c, f, m, w, h)
     return Area(x, y, w, h)
 
 def blit_rect(canvas, buf, x, y, w, h):
@@ -59,20 +92,47 @@ def blit_rect(canvas, buf, x, y, w, h):
     """
     # copy bytes from buf to self._buffer, one row at a time
 
+    # Read the canvas attributes once; each access is a dictionary lookup
     BPP = canvas.color_depth // 8
+    width = canvas.width
+    height = canvas.height
+    buffer = canvas._buffer
 
-    if x < 0 or y < 0 or x + w > canvas.width or y + h > canvas.height:
+    if x < 0 or y < 0 or x + w > width or y + h > height:
         raise ValueError("The provided x, y, w, h values are out of range")
 
-    if len(buf) != w * h * BPP:
-        print(f"len(buf)={len(buf)} w={w} h={h} self.color_depth={canvas.color_depth}")
-        raise ValueError("The source buffer is not the correct size")
-
-    for row in range(h):
-        source_begin = row * w * BPP
-        source_end = source_begin + w * BPP
-        dest_begin = ((y + row) * canvas.width + x) * BPP
-        dest_end = dest_begin + w * BPP
-        print(f"{source_begin=}, {source_end=}, source_len={source_end-source_begin}, {dest_begin=}, {dest_end=}, dest_len={dest_end-dest_begin}")
-        canvas._buffer[dest_begin : dest_end] = buf[source_begin : source_end]
+    expected = w * h * BPP
+    if len(buf) != expected:
+        raise ValueError(f"The source buffer is {len(buf)} bytes, expected {expected} (w={w}, h={h}, bpp={BPP})")
+
+    if x == 0 and w == width:
+        # Full width rows are contiguous in the canvas, so copy them all at once
+        dest_begin = y * w * BPP
+        buffer[dest_begin : dest_begin + expected] = buf
+        return Area(x, y, w, h)
+
+    row_bytes = w * BPP
+    dest_stride = width * BPP
+    dest_begin = (y * width + x) * BPP
+
+    if np is not None:
+        # Copy all the rows in one step through 2D views of both buffers
+        dest = np.frombuffer(buffer, dtype=np.uint8, count=height * dest_stride)
+        dest = dest.reshape(height, dest_stride)
+        dest[y : y + h, x * BPP : x * BPP + row_bytes] = np.frombuffer(buf, dtype=np.uint8).reshape(h, row_bytes)
+        return Area(x, y, w, h)
+
+    if _blit_rows is not None:
+        # Compiled row copy; the memoryview slice points it at the first destination row
+        _blit_rows(memoryview(buffer)[dest_begin:], buf, row_bytes, dest_stride)
+        return Area(x, y, w, h)
+
+    # Slicing memoryviews copies each row without allocating an intermediate bytes object
+    source = memoryview(buf)
+    dest = memoryview(buffer)
+    source_begin = 0
+    for _ in range(h):
+        dest[dest_begin : dest_begin + row_bytes] = source[source_begin : source_begin + row_bytes]
+        source_begin += row_bytes
+        dest_begin += dest_stride
     return Area(x, y, w, h)
\ No newline at end of file
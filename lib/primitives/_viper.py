@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2024 Brad Barnett
+#
+# SPDX-License-Identifier: MIT
+
+# The following if statement is used to prevent errors when linting the code.
+# It is not necessary to include it in your own code.
+if 0:
+    ptr8 = lambda x: x
+
+    class micropython:
+
+        @staticmethod
+        def viper(func):
+            return func
+
+
+@micropython.viper
+def _blit_rows(dest: ptr8, source, row_bytes: int, dest_stride: int):
+    # Copy the rows of a contiguous source buffer into dest, starting each row
+    # dest_stride bytes after the last.  dest must already point at the first row.
+    # Viper functions take at most 4 arguments, so the row count comes from len(source).
+    src = ptr8(source)
+    length = int(len(source))
+    s = 0
+    d = 0
+    while s < length:
+        for i in range(row_bytes):
+            dest[d + i] = src[s + i]
+        s += row_bytes
+        d += dest_stride
@@ -1,4 +1,7 @@
 
+# _colors must stay a single bytes literal (never a bytearray) so MicroPython can
+# freeze it into flash.  COLORS and the family slices taken from it are memoryviews,
+# so they read the frozen data in place without copying it to RAM.
 _colors = (
     # black
     b"\x00\x00\x00"
@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: MIT
 
+from array import array
+
 # 125 colors with only 0x00, 0x40, 0x80, 0xC0, 0xFF as RGB values
 NAMES = {
     0x000000: "Black",                 # Win16
@@ -132,6 +134,11 @@ NAMES = {
     0xFFFFFF: "White",                   # Win16
 }
 
+# Reverse of NAMES, so a color can be looked up by name without scanning NAMES,
+# e.g. INDICES["Navy"] == 0x000080.  Names used twice keep the later color, the same one
+# _define_named_colors leaves in the attribute.
+INDICES = {v: k for k, v in NAMES.items()}
+
 # The 16 colors marked with # Win16 above are the standard Windows 16-color palette.
 WIN16 = [0x000000, 0x000080, 0x008000, 0x008080, 0x800000, 0x800080, 0x808000, 0x808080,
          0xC0C0C0, 0x0000FF, 0x00FF00, 0x00FFFF, 0xFF0000, 0xFF00FF, 0xFFFF00, 0xFFFFFF]
@@ -172,7 +179,12 @@ class Palette:
             if index in self._cache:
                 return self._cache[index]
     
-        r, g, b = self._get_rgb(index)
+        color = self._pack(*self._get_rgb(index))
+        if self._cache is not None:
+            self._cache[index] = color
+        return color
+
+    def _pack(self, r, g, b):
         if self._color_depth == 24:
             return r << 16 | g << 8 | b
         elif self._color_depth == 16:
@@ -224,11 +236,27 @@ class MappedPalette(Palette):
     """
     A class to represent a color palette with a color map.
     """
-    def __init__(self, name, color_depth, swapped, color_map):
+    def __init__(self, name, color_depth, swapped, color_map, packed=None, offset=0):
         self._color_map = color_map
         self._length = len(color_map) // 3
+        # Pack every color once so lookups are a single index into an array
+        # instead of reading 3 bytes and packing them on every call.
+        # A palette built from a slice of another one's color_map can share
+        # that palette's packed array by passing it with the slice's offset.
+        self._color_depth = color_depth
+        self._swapped = swapped
+        if packed is None:
+            packed = array(
+                "H" if color_depth == 16 else "I",
+                [self._pack(*self._get_rgb(i)) for i in range(self._length)],
+            )
+        self._packed = packed
+        self._offset = offset
         super().__init__(name, color_depth, swapped)
 
+    def __getitem__(self, index):
+        return self._packed[self._offset + self._normalize(index)]
+
     def _get_rgb(self, index):
         r, g, b = self._color_map[index*3:index*3+3]
         return r, g, b
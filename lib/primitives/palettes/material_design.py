@@ -66,8 +66,8 @@ class Accents(_Palette):
 
     _accents = ["A100", "A200", "A400", "A700"]
 
-    def __init__(self, name, color_depth, swapped, color_map):
-        super().__init__(name, color_depth, swapped, color_map)
+    def __init__(self, name, color_depth, swapped, color_map, packed=None, offset=0):
+        super().__init__(name, color_depth, swapped, color_map, packed, offset)
 
     def _define_named_colors(self):
         for i, accent in enumerate(self._accents):
@@ -81,15 +81,18 @@ class Family(_Palette):
 
     _shades = ["S50", "S100", "S200", "S300", "S400", "S500", "S600", "S700", "S800", "S900"]
 
-    def __init__(self, name, color_depth, swapped, color_map):
-        super().__init__(name, color_depth, swapped, color_map)
+    def __init__(self, name, color_depth, swapped, color_map, packed=None, offset=0):
+        super().__init__(name, color_depth, swapped, color_map, packed, offset)
 
     def _define_named_colors(self):
         if len(self) > 1:
             for i, shade in enumerate(self._shades):
                 setattr(self, shade, self[i - 5])
         if len(self) > 10:
-            self.accents = Accents(self._name + "_accents", self._color_depth, self._swapped, self._color_map[-4 * 3 :])
+            self.accents = Accents(
+                self._name + "_accents", self._color_depth, self._swapped, self._color_map[-4 * 3 :],
+                self._packed, self._offset + len(self) - 4,
+            )
 
     def __getitem__(self, index):
         """Return the color variant as an integer with the number of bits specified in the color depth."""
@@ -122,8 +125,12 @@ class MDPalette(_Palette):
         self._name = name if name else "MaterialDesign"
 
     def _define_named_colors(self):
+        # The families share this palette's packed array instead of packing their own
         index = 0
         for name, length in zip(FAMILIES, LENGTHS):
-            setattr(self, name, Family(name, self._color_depth, self._swapped, self._color_map[index : index + length * 3]))
+            setattr(self, name, Family(
+                name, self._color_depth, self._swapped, self._color_map[index * 3 : (index + length) * 3],
+                self._packed, index,
+            ))
             setattr(self, name.upper(), getattr(self, name)[0])
-            index += length * 3
+            index += length
@@ -0,0 +1,45 @@
+"""Check the framebuf.py fill_rect fast paths against set_pixel."""
+
+import os
+import sys
+
+_root = os.path.join(os.path.dirname(__file__), "..")
+sys.path[:0] = [os.path.join(_root, "lib"), os.path.join(_root, "utils")]
+
+import pytest  # noqa: E402
+import framebuf  # noqa: E402
+
+FORMATS = [
+    (framebuf.MONO_HMSB, (0, 1)),
+    (framebuf.GS2_HMSB, (0, 1, 2, 3)),
+    (framebuf.MONO_VLSB, (0, 1)),
+    (framebuf.RGB565, (0x0000, 0xF81F)),
+]
+
+
+def _new(format, width, height):
+    # Big enough for any format, including whole MONO_VLSB pages
+    return framebuf.FrameBuffer(bytearray(width * height * 2), width, height, format)
+
+
+@pytest.mark.parametrize("width", [8, 13, 21])
+@pytest.mark.parametrize("format, colors", FORMATS)
+def test_fill_rect_matches_set_pixel(format, colors, width):
+    height = 11
+    rects = [(0, 0, width, height), (1, 2, 1, 1), (3, 1, 9, 6), (width - 5, 4, 5, 7), (2, 9, 3, 2)]
+    for x, y, w, h in rects:
+        for color in colors:
+            expected = _new(format, width, height)
+            actual = _new(format, width, height)
+            # Start from a pattern so bits outside the rect must be preserved
+            for fb in (expected, actual):
+                for py in range(height):
+                    for px in range(width):
+                        fb.pixel(px, py, colors[(px + py) % len(colors)])
+            for py in range(y, min(y + h, height)):
+                for px in range(x, min(x + w, width)):
+                    expected.pixel(px, py, color)
+            actual.fill_rect(x, y, w, h, color)
+            for py in range(height):
+                for px in range(width):
+                    assert actual.pixel(px, py) == expected.pixel(px, py), (x, y, w, h, color, px, py)